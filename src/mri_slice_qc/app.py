@@ -1,7 +1,10 @@
 import os
-import re
+import json
 import sys
+import time
 import datetime
+import collections
+import functools
 from typing import Optional, Tuple, List
 
 import numpy as np
@@ -13,26 +16,125 @@ from qtpy import QtWidgets, QtCore, QtGui
 import napari
 
 
-KEY_RE = re.compile(r"^(?P<phonetic>.+?)_(?P<series>.+?)_slice_(?P<slice>\d+)$")
+def now_epoch() -> int:
+    """Current time as integer Unix epoch seconds."""
+    return time.time_ns() // 1000000000
 
 
-def now_iso() -> str:
-    return datetime.datetime.now().isoformat(timespec="seconds")
+def _coerce_epoch(v):
+    """Timestamp cell -> int epoch seconds; ISO strings from older CSVs are converted."""
+    if _is_missing(v):
+        return v
+    if isinstance(v, str):
+        try:
+            return int(float(v))
+        except ValueError:
+            pass
+        try:
+            return int(datetime.datetime.fromisoformat(v.strip()).timestamp())
+        except ValueError:
+            return np.nan
+    try:
+        return int(v)
+    except Exception:
+        return np.nan
+
+
+def _is_missing(v) -> bool:
+    """True for None/NaN cells (what pandas gives back for empty CSV fields)."""
+    return v is None or (isinstance(v, float) and v != v)
+
+
+def _coerce_viewed(v) -> bool:
+    """Interpret a 'viewed' cell as read back from CSV/journal."""
+    if isinstance(v, (bool, np.bool_)):
+        return bool(v)
+    if isinstance(v, str):
+        return v.strip().lower() in ("true", "1", "yes", "y")
+    if _is_missing(v):
+        return False
+    try:
+        return bool(int(v))
+    except Exception:
+        return False
 
 
+def _csv_cell(v) -> str:
+    """Format one value the way pandas.read_csv reads it back."""
+    if isinstance(v, str):
+        if "," in v or '"' in v or "\n" in v or "\r" in v:
+            return '"' + v.replace('"', '""') + '"'
+        return v
+    if _is_missing(v):
+        return ""
+    if isinstance(v, (bool, np.bool_)):
+        return "True" if v else "False"
+    if isinstance(v, (float, np.floating)):
+        if v != v:
+            return ""
+        if float(v).is_integer():
+            return str(int(v))
+    return str(v)
+
+
+def _json_default(v):
+    # numpy scalars coming back from pandas
+    if isinstance(v, np.generic):
+        return v.item()
+    return str(v)
+
+
+@functools.lru_cache(maxsize=100000)
 def parse_key(key: str) -> Tuple[str, str, Optional[int]]:
-    """Returns (phonetic_id, series, slice_number or None)."""
-    m = KEY_RE.match(key)
-    if not m:
+    """Returns (phonetic_id, series, slice_number or None).
+
+    Keys look like ``{phonetic_id}_{series}_slice_{slice_number}``; phonetic_id is
+    everything up to the first underscore, series may itself contain underscores.
+    """
+    head, sep, num = key.rpartition("_slice_")
+    if not sep or not num.isdecimal():
         return key, "", None
-    phonetic = m.group("phonetic")
-    series = m.group("series")
-    slice_number = int(m.group("slice"))
-    return phonetic, series, slice_number
+    # First underscore after a non-empty phonetic_id
+    cut = head.find("_", 1)
+    if cut < 0 or cut == len(head) - 1:
+        return key, "", None
+    return head[:cut], head[cut + 1:], int(num)
+
+
+def open_h5(h5_path: str) -> h5py.File:
+    """Open an HDF5 file read-only with a large chunk cache, in SWMR mode when supported.
+
+    Each thread that reads should open its own handle.
+    """
+    cache = dict(rdcc_nbytes=256 * 1024 * 1024, rdcc_nslots=1000003, rdcc_w0=0.75)
+    try:
+        return h5py.File(h5_path, "r", libver="latest", swmr=True, **cache)
+    except (OSError, ValueError):
+        # Older HDF5 builds / file formats without SWMR support
+        return h5py.File(h5_path, "r", **cache)
+
+
+def list_datasets(h5f: h5py.File) -> List[str]:
+    """Names of all datasets in the file, without building a Group/Dataset wrapper per node."""
+    names = []
+    dataset_type = h5py.h5o.TYPE_DATASET
+
+    def _visit(name, info):
+        if info.type == dataset_type:
+            names.append(name.decode("utf-8"))
+
+    h5py.h5o.visit(h5f.id, _visit, info=True)
+    return names
 
 
 class CsvStore(object):
-    """Stores only viewed keys. Overwrites CSV on each update."""
+    """Stores only viewed keys as a dict of rows. Overwrites the output file on save().
+
+    The on-disk format follows the extension of csv_path: ``.feather`` and
+    ``.parquet`` (both need pyarrow) are written in binary form, anything else as CSV.
+    """
+
+    BINARY_FORMATS = {".feather": "feather", ".parquet": "parquet"}
 
     COLS = [
         "key",
@@ -47,70 +149,131 @@ class CsvStore(object):
 
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
-        self.df = pd.DataFrame(columns=self.COLS)
-        self.df.set_index("key", inplace=True, drop=False)
+        self.fmt = self.BINARY_FORMATS.get(os.path.splitext(csv_path)[1].lower(), "csv")
+        if self.fmt != "csv":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise RuntimeError("Saving .%s files requires pyarrow (pip install mri-slice-qc[arrow])." % self.fmt)
+
+        # One dict per key, in insertion order; a DataFrame is only built on save().
+        self._rows = {}
+        self._dirty_keys = set()
+
+        # Append-only journal of row updates since the last full save(). Named from
+        # the full output path so e.g. ratings.csv and ratings.feather never share one.
+        self.journal_path = csv_path + ".journal.jsonl"
+        self._journal_fp = None
 
         if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
             try:
-                loaded = pd.read_csv(csv_path)
+                loaded = self._read_table(csv_path)
                 if "key" in loaded.columns:
                     # Ensure required cols exist
                     for c in self.COLS:
                         if c not in loaded.columns:
                             loaded[c] = np.nan
                     loaded = loaded[self.COLS]
-                    loaded.set_index("key", inplace=True, drop=False)
-                    self.df = loaded
+                    self._rows = {r["key"]: self._normalize_row(r) for r in loaded.to_dict("records")}
             except Exception:
-                # If CSV can't be read, keep empty
+                # If the file can't be read, keep empty
                 pass
 
+        self._replay_journal()
+
+        # Cached so is_viewed() is a set lookup
+        self._viewed_set = {k for k, r in self._rows.items() if r["viewed"]}
+
+    @staticmethod
+    def _normalize_row(row: dict) -> dict:
+        """Coerce 'viewed' to bool, 'rating' to int and timestamps to epoch seconds once, when a row is loaded."""
+        row["viewed"] = _coerce_viewed(row["viewed"])
+        rating = row["rating"]
+        try:
+            row["rating"] = 0 if _is_missing(rating) else int(rating)
+        except Exception:
+            row["rating"] = 0
+        row["first_viewed_at"] = _coerce_epoch(row["first_viewed_at"])
+        row["last_updated_at"] = _coerce_epoch(row["last_updated_at"])
+        return row
+
+    def _read_table(self, path: str) -> pd.DataFrame:
+        if self.fmt == "feather":
+            return pd.read_feather(path)
+        if self.fmt == "parquet":
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+
+    def _replay_journal(self) -> None:
+        """Apply journaled rows that are newer than the CSV (e.g. after a crash)."""
+        if not os.path.exists(self.journal_path):
+            return
+        if os.path.exists(self.csv_path) and os.path.getmtime(self.journal_path) < os.path.getmtime(self.csv_path):
+            # Stale (its rows already reached the output file). Drop it now so this
+            # session's appends don't make it look newer than the output file later.
+            try:
+                os.remove(self.journal_path)
+            except OSError:
+                pass
+            return
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        # Partially written last line
+                        continue
+                    key = row.get("key")
+                    if key is None:
+                        continue
+                    self._rows[key] = self._normalize_row({c: row.get(c, np.nan) for c in self.COLS})
+                    self._dirty_keys.add(key)
+        except Exception:
+            pass
+
     def has_key(self, key: str) -> bool:
-        return key in self.df.index
+        return key in self._rows
 
     def get_rating(self, key: str) -> int:
-        if key in self.df.index:
-            try:
-                v = self.df.loc[key, "rating"]
-                if pd.isna(v):
-                    return 0
-                return int(v)
-            except Exception:
-                return 0
-        return 0
+        row = self._rows.get(key)
+        if row is None:
+            return 0
+        return row["rating"]
 
     def is_viewed(self, key: str) -> bool:
-        if key in self.df.index:
-            v = self.df.loc[key, "viewed"]
-            if isinstance(v, (bool, np.bool_)):
-                return bool(v)
-            if isinstance(v, str):
-                return v.strip().lower() in ("true", "1", "yes", "y")
-            if pd.isna(v):
-                return False
-            try:
-                return bool(int(v))
-            except Exception:
-                return False
-        return False
-
-    def mark_viewed(self, key: str) -> None:
-        if key not in self.df.index:
-            phonetic, series, slice_number = parse_key(key)
-            self.df.loc[key, "key"] = key
-            self.df.loc[key, "phonetic_id"] = phonetic
-            self.df.loc[key, "series"] = series
-            self.df.loc[key, "slice_number"] = slice_number if slice_number is not None else np.nan
-            self.df.loc[key, "rating"] = 0
-            self.df.loc[key, "viewed"] = True
-            ts = now_iso()
-            self.df.loc[key, "first_viewed_at"] = ts
-            self.df.loc[key, "last_updated_at"] = ts
-        else:
-            self.df.loc[key, "viewed"] = True
-            if pd.isna(self.df.loc[key, "first_viewed_at"]):
-                self.df.loc[key, "first_viewed_at"] = now_iso()
-            self.df.loc[key, "last_updated_at"] = now_iso()
+        return key in self._viewed_set
+
+    @property
+    def viewed_keys(self):
+        """Live set of viewed keys (read-only use)."""
+        return self._viewed_set
+
+    def mark_viewed(self, key: str, parsed: Optional[Tuple[str, str, Optional[int]]] = None) -> None:
+        """Mark key as viewed. parsed is parse_key(key) if the caller already has it."""
+        ts = now_epoch()
+        row = self._rows.get(key)
+        if row is None:
+            phonetic, series, slice_number = parsed if parsed is not None else parse_key(key)
+            row = self._rows[key] = {
+                "key": key,
+                "phonetic_id": phonetic,
+                "series": series,
+                "slice_number": slice_number if slice_number is not None else np.nan,
+                "rating": 0,
+                "viewed": True,
+                "first_viewed_at": ts,
+                "last_updated_at": ts,
+            }
+        row["viewed"] = True
+        if _is_missing(row["first_viewed_at"]):
+            row["first_viewed_at"] = ts
+        row["last_updated_at"] = ts
+        self._viewed_set.add(key)
+        self._dirty_keys.add(key)
 
     def set_rating(self, key: str, rating: int) -> None:
         rating = int(rating)
@@ -118,16 +281,198 @@ class CsvStore(object):
             rating = 0
         if rating > 3:
             rating = 3
-        if key not in self.df.index:
+        if key not in self._rows:
             self.mark_viewed(key)
-        self.df.loc[key, "rating"] = rating
-        self.df.loc[key, "last_updated_at"] = now_iso()
+        row = self._rows[key]
+        row["rating"] = rating
+        row["last_updated_at"] = now_epoch()
+        self._dirty_keys.add(key)
+
+    def append_journal(self, key: str) -> None:
+        """Append the current row for key to the journal if it changed since the last write."""
+        if key not in self._dirty_keys:
+            return
+        if self._journal_fp is None:
+            outdir = os.path.dirname(os.path.abspath(self.journal_path))
+            if outdir and not os.path.exists(outdir):
+                os.makedirs(outdir, exist_ok=True)
+            self._journal_fp = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_fp.write(json.dumps(self._rows[key], default=_json_default) + "\n")
+        # Hand the line to the OS so it survives an app crash; no fsync.
+        self._journal_fp.flush()
+        self._dirty_keys.discard(key)
 
     def save(self) -> None:
         outdir = os.path.dirname(os.path.abspath(self.csv_path))
         if outdir and not os.path.exists(outdir):
             os.makedirs(outdir, exist_ok=True)
-        self.df.to_csv(self.csv_path, index=False)
+        # Write to a temp file and swap it in, so a crash mid-write never leaves a
+        # truncated output file that is newer than the journal.
+        tmp_path = self.csv_path + ".tmp"
+        if self.fmt == "csv":
+            self._write_csv(tmp_path)
+        else:
+            df = pd.DataFrame.from_records(list(self._rows.values()), columns=self.COLS)
+            if self.fmt == "feather":
+                df.to_feather(tmp_path)
+            else:
+                df.to_parquet(tmp_path, compression="zstd", index=False)
+        os.replace(tmp_path, self.csv_path)
+        self._dirty_keys.clear()
+
+        # Everything journaled so far is now in the output file
+        if self._journal_fp is not None:
+            self._journal_fp.close()
+            self._journal_fp = None
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def export_csv(self, path: str) -> None:
+        """Write the current rows as CSV to path, whatever the store's own format."""
+        outdir = os.path.dirname(os.path.abspath(path))
+        if outdir and not os.path.exists(outdir):
+            os.makedirs(outdir, exist_ok=True)
+        tmp_path = path + ".tmp"
+        self._write_csv(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _write_csv(self, path: str) -> None:
+        # Direct writer: 8 fixed columns, so skip DataFrame.to_csv's per-cell machinery
+        cols = self.COLS
+        with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            f.write(",".join(cols) + "\n")
+            for row in self._rows.values():
+                f.write(",".join([_csv_cell(row[c]) for c in cols]) + "\n")
+
+    def close(self) -> None:
+        self.save()
+
+
+class Prefetcher(QtCore.QThread):
+    """Background reader that keeps a small LRU cache of recently requested slices.
+
+    Owns its own read-only h5py handle; the GUI thread's handle is never shared.
+    """
+
+    def __init__(self, h5_path: str, maxlen: int = 4, parent=None):
+        super(Prefetcher, self).__init__(parent)
+        self.h5_path = h5_path
+        self.maxlen = maxlen
+        self._cache = collections.OrderedDict()
+        self._queue = collections.deque()
+        self._mutex = QtCore.QMutex()
+        self._cond = QtCore.QWaitCondition()
+        # Key the worker is reading right now; get() waits on _done instead of
+        # making the GUI thread read the same dataset a second time.
+        self._inflight = None
+        self._done = QtCore.QWaitCondition()
+        self._stopping = False
+
+    def prefetch_only(self, keys: List[str]) -> None:
+        """Replace any pending jobs with keys (neighbours of slices already left are dropped)."""
+        self._mutex.lock()
+        try:
+            self._queue.clear()
+            for key in keys:
+                if key not in self._cache and key not in self._queue and key != self._inflight:
+                    self._queue.append(key)
+            if self._queue:
+                self._cond.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        self._mutex.lock()
+        try:
+            while self._inflight == key:
+                self._done.wait(self._mutex)
+            arr = self._cache.get(key)
+            if arr is not None:
+                self._cache.move_to_end(key)
+            return arr
+        finally:
+            self._mutex.unlock()
+
+    def stop(self) -> None:
+        self._mutex.lock()
+        try:
+            self._stopping = True
+            self._queue.clear()
+            self._cond.wakeAll()
+        finally:
+            self._mutex.unlock()
+        self.wait()
+
+    def run(self):
+        try:
+            h5f = open_h5(self.h5_path)
+        except Exception:
+            return
+        try:
+            while True:
+                self._mutex.lock()
+                try:
+                    while not self._queue and not self._stopping:
+                        self._cond.wait(self._mutex)
+                    if self._stopping:
+                        return
+                    key = self._queue.popleft()
+                    self._inflight = key
+                finally:
+                    self._mutex.unlock()
+
+                try:
+                    arr = h5f[key][()]
+                except Exception:
+                    arr = None
+
+                self._mutex.lock()
+                try:
+                    if arr is not None and arr.ndim == 3:
+                        self._cache[key] = arr
+                        self._cache.move_to_end(key)
+                        while len(self._cache) > self.maxlen:
+                            self._cache.popitem(last=False)
+                    self._inflight = None
+                    self._done.wakeAll()
+                finally:
+                    self._mutex.unlock()
+        finally:
+            h5f.close()
+
+
+class KeyListModel(QtCore.QAbstractListModel):
+    """List model over the slice keys; background color comes straight from the viewed set.
+
+    Only viewed rows carry a BackgroundRole; the not-viewed color is the view's
+    stylesheet background (see KeyComboBox).
+    """
+
+    def __init__(self, keys: List[str], viewed, parent=None):
+        super(KeyListModel, self).__init__(parent)
+        self._keys = keys
+        # Live reference (CsvStore.viewed_keys); never copied
+        self._viewed_set = viewed
+        self._bg_viewed = QtGui.QColor(200, 255, 200)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._keys)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self._keys[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return key
+        if role == QtCore.Qt.BackgroundRole:
+            return self._bg_viewed if key in self._viewed_set else None
+        return None
+
+    def refresh_row(self, row: int) -> None:
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, [QtCore.Qt.BackgroundRole])
 
 
 class KeyComboBox(QtWidgets.QComboBox):
@@ -136,12 +481,20 @@ class KeyComboBox(QtWidgets.QComboBox):
     def __init__(self, parent=None):
         super(KeyComboBox, self).__init__(parent)
         self.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
-
-    def set_item_viewed(self, idx: int, viewed: bool) -> None:
-        if idx < 0:
+        # Not-viewed (red) default for every item. Styled on the view rather than
+        # ::item so the model's green BackgroundRole still paints over it.
+        self.setStyleSheet("QComboBox QAbstractItemView { background: rgb(255, 220, 220); }")
+        self._model = None
+
+    def set_keys(self, keys: List[str], viewed) -> None:
+        self._model = KeyListModel(keys, viewed, self)
+        self.setModel(self._model)
+
+    def refresh_item(self, idx: int) -> None:
+        """Repaint one item after its viewed state changed."""
+        if idx < 0 or self._model is None:
             return
-        bg = QtGui.QColor(200, 255, 200) if viewed else QtGui.QColor(255, 220, 220)
-        self.setItemData(idx, bg, QtCore.Qt.BackgroundRole)
+        self._model.refresh_row(idx)
 
 
 class ControlPanel(QtWidgets.QWidget):
@@ -178,6 +531,10 @@ class ControlPanel(QtWidgets.QWidget):
             rb.setFont(f)
             self.grp_layout.addWidget(rb)
 
+        self.rating_group = QtWidgets.QButtonGroup(self)
+        for rating, rb in enumerate([self.rb0, self.rb1, self.rb2, self.rb3]):
+            self.rating_group.addButton(rb, rating)
+
         self.rb0.setChecked(True)
 
         nav_layout = QtWidgets.QHBoxLayout()
@@ -200,23 +557,20 @@ class ControlPanel(QtWidgets.QWidget):
         self.btn_next.clicked.connect(self.sig_next.emit)
         self.combo.currentIndexChanged.connect(self._on_combo_changed)
 
-        self.rb0.toggled.connect(lambda checked: self._emit_rating(0, checked))
-        self.rb1.toggled.connect(lambda checked: self._emit_rating(1, checked))
-        self.rb2.toggled.connect(lambda checked: self._emit_rating(2, checked))
-        self.rb3.toggled.connect(lambda checked: self._emit_rating(3, checked))
+        # One signal per user click; programmatic setChecked() doesn't emit it
+        try:
+            self.rating_group.idClicked.connect(self.sig_rating_changed.emit)
+        except AttributeError:
+            # Qt < 5.15
+            self.rating_group.buttonClicked[int].connect(self.sig_rating_changed.emit)
 
     def _on_combo_changed(self, idx: int) -> None:
         if idx >= 0:
             self.sig_select_idx.emit(idx)
 
-    def _emit_rating(self, rating: int, checked: bool) -> None:
-        if checked:
-            self.sig_rating_changed.emit(rating)
-
-    def set_keys(self, keys: List[str]) -> None:
+    def set_keys(self, keys: List[str], viewed) -> None:
         self.combo.blockSignals(True)
-        self.combo.clear()
-        self.combo.addItems(keys)
+        self.combo.set_keys(keys, viewed)
         self.combo.blockSignals(False)
 
     def set_current_index(self, idx: int) -> None:
@@ -229,15 +583,23 @@ class ControlPanel(QtWidgets.QWidget):
         self.lbl_status.setText(f"Status: {s_viewed} | Rating: {rating} | {idx+1}/{n}\n{key}")
 
     def set_rating_buttons(self, rating: int) -> None:
+        """Reflect a stored rating in the UI without emitting sig_rating_changed."""
         rating = int(rating)
-        if rating <= 0:
-            self.rb0.setChecked(True)
-        elif rating == 1:
-            self.rb1.setChecked(True)
-        elif rating == 2:
-            self.rb2.setChecked(True)
-        else:
-            self.rb3.setChecked(True)
+        widgets = [self.rating_group] + self.rating_group.buttons()
+        for w in widgets:
+            w.blockSignals(True)
+        try:
+            if rating <= 0:
+                self.rb0.setChecked(True)
+            elif rating == 1:
+                self.rb1.setChecked(True)
+            elif rating == 2:
+                self.rb2.setChecked(True)
+            else:
+                self.rb3.setChecked(True)
+        finally:
+            for w in widgets:
+                w.blockSignals(False)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -246,16 +608,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("MRI Slice QC (0–3)")
 
         self.h5_path = h5_path
-        self.h5 = h5py.File(h5_path, "r")
-
-        keys = []
-
-        def _visit(name, obj):
-            if isinstance(obj, h5py.Dataset):
-                keys.append(name)
-
-        self.h5.visititems(_visit)
-        self.keys = sorted(keys)
+        self.h5 = open_h5(h5_path)
+        self._read_buf = None
+        self._tyx_buf = None
+
+        keys = list_datasets(self.h5)
+
+        # Parse every key once and sort by (phonetic_id, series, slice_number) so
+        # slice_2 comes before slice_10; slice number -1 means "no slice number".
+        decorated = [
+            ((p[0], p[1], -1 if p[2] is None else p[2]), k, p)
+            for k, p in zip(keys, map(parse_key, keys))
+        ]
+        # Keys are unique, so the parsed tuple (which may hold None) is never compared
+        decorated.sort()
+        self.keys = [d[1] for d in decorated]
+        parsed = [d[2] for d in decorated]
+        self._phonetic = np.array([p[0] for p in parsed], dtype=object)
+        self._series = np.array([p[1] for p in parsed], dtype=object)
+        self._slice_num = np.array([-1 if p[2] is None else p[2] for p in parsed], dtype=np.int32)
 
         if len(self.keys) == 0:
             raise RuntimeError("No datasets found in the HDF5 file.")
@@ -266,7 +637,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.img_layer = None
 
         self.panel = ControlPanel()
-        self.panel.set_keys(self.keys)
+        self.panel.set_keys(self.keys, self.store.viewed_keys)
 
         central = QtWidgets.QWidget()
         layout = QtWidgets.QHBoxLayout(central)
@@ -275,10 +646,20 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(central)
         self.installEventFilter(self)
 
+        file_menu = self.menuBar().addMenu("&File")
+        act_export = file_menu.addAction("Export CSV…")
+        act_export.triggered.connect(self.export_csv)
+
 
         self.cur_idx = 0
         self._loading = False
 
+        # Full CSV rewrite is coalesced; every change is journaled immediately.
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self._save_store)
+
         self.panel.sig_prev.connect(self.on_prev)
         self.panel.sig_next.connect(self.on_next)
         self.panel.sig_select_idx.connect(self.on_select_idx)
@@ -286,6 +667,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.panel.btn_next_unviewed.clicked.connect(self.goto_next_unviewed)
 
 
+        # Reads keys[cur_idx +/- 1] while the user looks at the current slice
+        self.prefetcher = Prefetcher(h5_path, parent=self)
+        self.prefetcher.start()
+
         # self.load_idx(0)
         # Defer first load until after the window is shown
         self.cur_idx = 0
@@ -293,8 +678,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     def closeEvent(self, event):
+        self._save_timer.stop()
         try:
-            self.store.save()
+            self.store.close()
+        except Exception:
+            pass
+        try:
+            self.prefetcher.stop()
         except Exception:
             pass
         try:
@@ -372,14 +762,42 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._loading:
             return
         key = self.keys[self.cur_idx]
+        # idClicked also fires when the already-checked button is clicked again
+        if self.store.has_key(key) and self.store.get_rating(key) == rating:
+            return
         self.store.set_rating(key, rating)
         self._refresh_item_colors()
         self._refresh_status()
-        self.store.save()
+        self._persist(key)
+
+    def _persist(self, key: str) -> None:
+        """Journal the row for key and schedule a coalesced full save."""
+        try:
+            self.store.append_journal(key)
+        except Exception:
+            pass
+        self._save_timer.start()
+
+    def export_csv(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export ratings as CSV", "", "CSV Files (*.csv);;All Files (*)"
+        )
+        if not path:
+            return
+        try:
+            self.store.export_csv(path)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", "Could not export CSV: %s" % e)
+
+    def _save_store(self) -> None:
+        try:
+            self.store.save()
+        except Exception:
+            pass
 
     def _refresh_item_colors(self):
-        for i, k in enumerate(self.keys):
-            self.panel.combo.set_item_viewed(i, self.store.is_viewed(k))
+        # Only the current key can change viewed state
+        self.panel.combo.refresh_item(self.cur_idx)
 
     def _refresh_status(self):
         key = self.keys[self.cur_idx]
@@ -436,57 +854,115 @@ class MainWindow(QtWidgets.QMainWindow):
         # 0ms works often; 25–50ms is more reliable across machines/Qt backends
         QtCore.QTimer.singleShot(25, _do)
 
+    def _read_dataset(self, key: str) -> np.ndarray:
+        """Read a dataset into a reused buffer (reallocated only when shape/dtype change)."""
+        dset = self.h5[key]
+        if dset.ndim != 3:
+            raise RuntimeError("Dataset is not 3D (rows, cols, timepoints): %s (shape=%s)" % (key, dset.shape))
+        buf = self._read_buf
+        if buf is None or buf.shape != dset.shape or buf.dtype != dset.dtype:
+            buf = np.empty(dset.shape, dtype=dset.dtype)
+            self._read_buf = buf
+        dset.read_direct(buf)
+        return buf
+
+    def _parsed_key(self, idx: int) -> Tuple[str, str, Optional[int]]:
+        slice_number = int(self._slice_num[idx])
+        return self._phonetic[idx], self._series[idx], (slice_number if slice_number >= 0 else None)
+
+    def _to_tyx(self, arr: np.ndarray) -> np.ndarray:
+        """Copy (rows, cols, time) into a reused C-contiguous (time, rows, cols) buffer."""
+        shape_tyx = (arr.shape[2], arr.shape[0], arr.shape[1])
+        buf = self._tyx_buf
+        if buf is None or buf.shape != shape_tyx or buf.dtype != arr.dtype:
+            # Keep the source dtype (e.g. int16) rather than promoting
+            buf = np.empty(shape_tyx, dtype=arr.dtype)
+            self._tyx_buf = buf
+        np.copyto(buf, np.moveaxis(arr, -1, 0))
+        return buf
+
+    @staticmethod
+    def _contrast_limits(arr_tyx: np.ndarray) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """(1st/99th percentile, min/max) over ~8 evenly spaced frames.
+
+        The percentiles are the initial contrast; min/max bound the slider so
+        bright artifacts can still be brought into range.
+        """
+        step = max(1, arr_tyx.shape[0] // 8)
+        vmin, lo, hi, vmax = (float(v) for v in np.percentile(arr_tyx[::step], [0, 1, 99, 100]))
+        # napari needs a finite, non-empty range
+        if not all(np.isfinite(v) for v in (vmin, lo, hi, vmax)):
+            return (0.0, 1.0), (0.0, 1.0)
+        if vmax <= vmin:
+            vmax = vmin + 1.0
+        if hi <= lo:
+            lo, hi = vmin, vmax
+        return (lo, hi), (vmin, vmax)
+
     def load_idx(self, idx: int):
         if idx < 0 or idx >= len(self.keys):
             return
 
-        # Overwrite CSV on advance (as requested)
-        try:
-            self.store.save()
-        except Exception:
-            pass
-
+        # Set before any UI update so nothing below is mistaken for a user rating change
         self._loading = True
-        self.cur_idx = idx
-        key = self.keys[idx]
-
-        arr = self.h5[key][()]
-        if arr.ndim != 3:
-            raise RuntimeError("Dataset is not 3D (rows, cols, timepoints): %s (shape=%s)" % (key, arr.shape))
-
-        # (rows, cols, time) -> (time, rows, cols)
-        arr_tyx = np.transpose(arr, (2, 0, 1))
-
-        if self.img_layer is None:
-            self.img_layer = self.viewer.add_image(arr_tyx, name="slice", axis_labels=("t", "y", "x"))
-        else:
-            self.img_layer.data = arr_tyx
-            self.img_layer.name = "slice"
-        # Auto-play if time series
-        n_t = arr_tyx.shape[0]
-        self._start_or_stop_animation(n_t)
-
-
-
-        # Mark as viewed on load
-        self.store.mark_viewed(key)
-
-        # Sync selection + UI
-        self.panel.set_current_index(idx)
-        self._refresh_item_colors()
-        self._refresh_status()
-
-        # Overwrite CSV on view
-        self.store.save()
+        try:
+            self.cur_idx = idx
+            key = self.keys[idx]
 
-        self._loading = False
+            arr = self.prefetcher.get(key)
+            if arr is None:
+                arr = self._read_dataset(key)
+
+            # (rows, cols, time) -> (time, rows, cols), written once into contiguous memory
+            arr_tyx = self._to_tyx(arr)
+
+            # Contrast from a few frames so napari doesn't scan the whole stack
+            limits, limits_range = self._contrast_limits(arr_tyx)
+            if self.img_layer is None:
+                self.img_layer = self.viewer.add_image(
+                    arr_tyx,
+                    name="slice",
+                    axis_labels=("t", "y", "x"),
+                    multiscale=False,
+                    rgb=False,
+                    cache=False,
+                    contrast_limits=limits,
+                )
+                self.img_layer.contrast_limits_range = limits_range
+            else:
+                self.img_layer.contrast_limits_range = limits_range
+                self.img_layer.contrast_limits = limits
+                self.img_layer.data = arr_tyx
+                self.img_layer.name = "slice"
+            # Auto-play if time series
+            n_t = arr_tyx.shape[0]
+            self._start_or_stop_animation(n_t)
+
+            # Mark as viewed on load
+            self.store.mark_viewed(key, self._parsed_key(idx))
+
+            # Sync selection + UI
+            self.panel.set_current_index(idx)
+            self._refresh_item_colors()
+            self._refresh_status()
+
+            # Journal the view; the CSV itself is rewritten by the save timer
+            self._persist(key)
+        finally:
+            self._loading = False
+
+        # Warm the cache for Next/Prev
+        self.prefetcher.prefetch_only([self.keys[j] for j in (idx + 1, idx - 1) if 0 <= j < len(self.keys)])
+
+
+OUTPUT_FILE_FILTER = "CSV Files (*.csv);;Feather Files (*.feather);;Parquet Files (*.parquet);;All Files (*)"
 
 
 def prompt_csv_path() -> Optional[str]:
     msg = QtWidgets.QMessageBox()
     msg.setIcon(QtWidgets.QMessageBox.Question)
     msg.setWindowTitle("MRI Slice QC")
-    msg.setText("Choose output CSV option:")
+    msg.setText("Choose output CSV option:\n(.feather / .parquet files are also supported)")
     btn_new = msg.addButton("Create new CSV", QtWidgets.QMessageBox.AcceptRole)
     btn_load = msg.addButton("Load existing CSV", QtWidgets.QMessageBox.AcceptRole)
     msg.addButton("Cancel", QtWidgets.QMessageBox.RejectRole)
@@ -496,13 +972,13 @@ def prompt_csv_path() -> Optional[str]:
 
     if clicked == btn_new:
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            None, "Create new output CSV", "", "CSV Files (*.csv);;All Files (*)"
+            None, "Create new output CSV", "", OUTPUT_FILE_FILTER
         )
         return path if path else None
 
     if clicked == btn_load:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            None, "Select existing output CSV", "", "CSV Files (*.csv);;All Files (*)"
+            None, "Select existing output CSV", "", OUTPUT_FILE_FILTER
         )
         return path if path else None
 